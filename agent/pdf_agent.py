@@ -36,17 +36,23 @@ class PDFExtractionAgent(BaseAgent):
         self.update_state_status(state, stage, "processing", "Extracting PDF content...")
         
         try:
-            # Validate PDF path
+            # Validate PDF path (suffix check needs no syscall; existence is
+            # checked by the single open below instead of a separate stat)
             pdf_path = Path(state.pdf_path)
-            if not pdf_path.exists() or pdf_path.suffix.lower() != ".pdf":
+            if pdf_path.suffix.lower() != ".pdf":
                 error_msg = f"Invalid PDF path: {state.pdf_path}"
                 self.update_state_status(state, stage, "failed", error=error_msg)
                 state.add_error(error_msg)
                 return {"success": False, "error": error_msg}
-            
+
             # Read PDF bytes
             try:
                 pdf_bytes = pdf_path.read_bytes()
+            except (FileNotFoundError, IsADirectoryError):
+                error_msg = f"Invalid PDF path: {state.pdf_path}"
+                self.update_state_status(state, stage, "failed", error=error_msg)
+                state.add_error(error_msg)
+                return {"success": False, "error": error_msg}
             except Exception as e:
                 error_msg = f"Failed to read PDF: {str(e)}"
                 self.update_state_status(state, stage, "failed", error=error_msg)
@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures for the DesignMind test suite
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import create_autospec, patch
+
+import google.generativeai
+import pytest
+
+from state.schema import REQUIRED_GEMINI_KEYS
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_genai():
+    """Fake Gemini keys and a mocked genai module, set up once for the whole session"""
+    with patch.dict(os.environ, {key: f"test-{key}" for key in REQUIRED_GEMINI_KEYS}):
+        with patch("agent.base_agent.genai") as genai:
+            # Autospec so a misspelled model method fails instead of returning a Mock
+            genai.GenerativeModel.return_value = create_autospec(
+                google.generativeai.GenerativeModel, instance=True
+            )
+            yield genai
+
+
+@pytest.fixture(scope="module")
+def pdf_agent(_stub_genai):
+    from agent.pdf_agent import PDFExtractionAgent
+    return PDFExtractionAgent()
+
+
+@pytest.fixture(scope="module")
+def auth_agent(_stub_genai):
+    from agent.auth_agent import AuthIntegrationsAgent
+    return AuthIntegrationsAgent()
+
+
+@pytest.fixture(scope="module")
+def domain_agent(_stub_genai):
+    from agent.domain_agent import DomainAPIAgent
+    return DomainAPIAgent()
+
+
+@pytest.fixture(scope="module")
+def behavior_agent(_stub_genai):
+    from agent.behavior_agent import BehaviorQualityAgent
+    return BehaviorQualityAgent()
+
+
+@pytest.fixture
+def llm_response(_stub_genai):
+    """Setter for the text the shared model returns; cleared again after the test"""
+    generate_content = _stub_genai.GenerativeModel.return_value.generate_content
+
+    def _set(text):
+        response = SimpleNamespace(text=text)
+        generate_content.return_value = response
+        return response
+
+    yield _set
+    generate_content.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def workflows(_stub_genai):
+    """The three compiled workflow types, built once and shared read-only"""
+    from workflow import create_hld_workflow
+    return {t: create_hld_workflow(t) for t in ("sequential", "parallel", "conditional")}
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """The module-level DEFAULT_CONFIG, validated once at import; tests treat it as immutable"""
+    from state.schema import DEFAULT_CONFIG
+    return DEFAULT_CONFIG
@@ -4,11 +4,15 @@ Defines the graph structure and execution flow for HLD generation
 Located at root level for easy access and graph visualization
 """
 
-from typing import Dict, Any
-from langgraph.graph import StateGraph, END
-from langchain_core.runnables import Runnable
+from functools import lru_cache
+from typing import Dict, Any, TYPE_CHECKING
 
-from nodes import NodeManager
+from nodes import get_node_manager
+from state.schema import ParallelHLDState
+
+# langgraph and langchain load on the first graph build, not on import
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
 
 
 class WorkflowGraph:
@@ -16,9 +20,9 @@ class WorkflowGraph:
 
     def __init__(self):
         """Initialize the workflow graph with node manager"""
-        self.node_manager = NodeManager()
+        self.node_manager = get_node_manager()
 
-    def create_sequential_workflow_graph(self) -> Runnable:
+    def create_sequential_workflow_graph(self) -> "Runnable":
         """
         Create the standard LangGraph workflow for HLD generation
         Executes nodes sequentially in order
@@ -26,6 +30,8 @@ class WorkflowGraph:
         Returns:
             Compiled LangGraph workflow
         """
+        from langgraph.graph import StateGraph, END
+
         node_runnables = self.node_manager.get_node_runnables()
 
         # Create state graph
@@ -49,17 +55,22 @@ class WorkflowGraph:
         # Compile and return the graph
         return workflow.compile()
 
-    def create_parallel_workflow_graph(self) -> Runnable:
+    def create_parallel_workflow_graph(self) -> "Runnable":
         """
-        Create a workflow with optimized sequential execution
-        Note: True parallel execution causes state update conflicts in LangGraph
+        Create a workflow that fans out the three independent analysis stages
+        Authentication, domain and behavior analysis only read the extracted
+        PDF content, so they run concurrently between extraction and diagrams
 
         Returns:
-            Compiled LangGraph workflow with optimized sequential flow
+            Compiled LangGraph workflow with a fan-out/fan-in analysis step
         """
-        node_runnables = self.node_manager.get_node_runnables()
+        from langgraph.graph import StateGraph, END
 
-        workflow = StateGraph(Dict[str, Any])
+        node_runnables = self.node_manager.get_node_update_runnables()
+
+        # Reducer-annotated state lets the concurrent branches' partial
+        # updates merge instead of conflicting
+        workflow = StateGraph(ParallelHLDState)
 
         # Add all nodes
         for node_name, node_runnable in node_runnables.items():
@@ -68,17 +79,17 @@ class WorkflowGraph:
         # Set entry point
         workflow.set_entry_point("pdf_extraction")
 
-        # Optimized sequential flow (faster than regular sequential)
-        workflow.add_edge("pdf_extraction", "auth_integrations")
-        workflow.add_edge("auth_integrations", "domain_api_design")
-        workflow.add_edge("domain_api_design", "behavior_quality")
-        workflow.add_edge("behavior_quality", "diagram_generation")
+        # Fan out after extraction, join before diagram generation
+        analysis_nodes = ["auth_integrations", "domain_api_design", "behavior_quality"]
+        for node_name in analysis_nodes:
+            workflow.add_edge("pdf_extraction", node_name)
+        workflow.add_edge(analysis_nodes, "diagram_generation")
         workflow.add_edge("diagram_generation", "output_composition")
         workflow.add_edge("output_composition", END)
 
         return workflow.compile()
 
-    def create_conditional_workflow_graph(self) -> Runnable:
+    def create_conditional_workflow_graph(self) -> "Runnable":
         """
         Create a workflow with conditional routing based on state
         Routes to next node based on execution results
@@ -86,6 +97,8 @@ class WorkflowGraph:
         Returns:
             Compiled LangGraph workflow with conditional edges
         """
+        from langgraph.graph import StateGraph, END
+
         node_runnables = self.node_manager.get_node_runnables()
 
         workflow = StateGraph(Dict[str, Any])
@@ -148,14 +161,14 @@ class WorkflowGraph:
 
         return workflow.compile()
 
-    def create_graph(self, graph_type: str = "sequential") -> Runnable:
+    def create_graph(self, graph_type: str = "sequential") -> "Runnable":
         """
         Factory method to create different workflow graph types
 
         Args:
             graph_type: Type of graph to create
                        - "sequential": Standard sequential execution
-                       - "parallel": Optimized sequential execution
+                       - "parallel": Concurrent analysis stages
                        - "conditional": Conditional routing based on state
 
         Returns:
@@ -203,19 +216,23 @@ class WorkflowGraph:
 
 
 # Convenience functions for backward compatibility
-def create_workflow_graph() -> Runnable:
+# Compiled graphs hold no per-run state, so each is built once per process
+@lru_cache(maxsize=1)
+def create_workflow_graph() -> "Runnable":
     """Create the standard LangGraph workflow for HLD generation"""
     graph = WorkflowGraph()
     return graph.create_sequential_workflow_graph()
 
 
-def create_parallel_workflow_graph() -> Runnable:
-    """Create a workflow with optimized sequential execution"""
+@lru_cache(maxsize=1)
+def create_parallel_workflow_graph() -> "Runnable":
+    """Create a workflow that runs the analysis stages concurrently"""
     graph = WorkflowGraph()
     return graph.create_parallel_workflow_graph()
 
 
-def create_conditional_workflow_graph() -> Runnable:
+@lru_cache(maxsize=1)
+def create_conditional_workflow_graph() -> "Runnable":
     """Create a workflow with conditional routing based on state"""
     graph = WorkflowGraph()
     return graph.create_conditional_workflow_graph()
@@ -3,6 +3,7 @@
 
 import os
 import sys
+import html
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -11,14 +12,12 @@ import traceback
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 
-# LangGraph workflow
-from workflow import create_hld_workflow
-from state.schema import WorkflowInput, ConfigSchema
+from utils import pdf_discovery
 
-# UI components
-from diagram_publisher import render_mermaid_inline
+# The LangGraph workflow, state schemas and the Mermaid renderer are imported
+# inside the code paths that use them, so reruns that never reach those paths
+# skip the import cost
 
 # ML modules
 try:
@@ -46,30 +45,45 @@ STYLES = """
 .status-processing{color:#ffc107;font-weight:600}
 .status-failed{color:#dc3545;font-weight:600}
 .status-pending{color:#6c757d;font-weight:600}
+table.card{width:100%;border-collapse:collapse}
+table.card th,table.card td{padding:4px 8px;text-align:left;border-bottom:1px solid #eee}
 </style>
 """
-st.markdown(STYLES, unsafe_allow_html=True)
-
-def _to_py(o):
-    """Normalize LLM JSON-ish like {'0': 'A', '1': 'B'} -> ['A','B'] recursively."""
-    if isinstance(o, dict):
-        keys = list(o.keys())
-        if keys and all(str(k).isdigit() for k in keys):
-            return [_to_py(o[str(i)]) for i in sorted(map(int, keys))]
-        return {k: _to_py(v) for k, v in o.items()}
-    if isinstance(o, list):
-        return [_to_py(v) for v in o]
-    return o
-
-def _as_list(x):
-    x = _to_py(x)
-    if x is None: return []
-    return x if isinstance(x, list) else [x]
-
-def _pills(title, items):
-    if not items: return
-    st.markdown(f"<div class='h3'>{title}</div>", unsafe_allow_html=True)
-    st.markdown("<div class='pills'>" + "".join(f"<span class='pill'>{str(i)}</span>" for i in items) + "</div>", unsafe_allow_html=True)
+
+def _pills_html(items):
+    parts = ["<div class='pills'>"]
+    parts.extend("<span class='pill'>" + html.escape(str(i)) + "</span>" for i in items)
+    parts.append("</div>")
+    return "".join(parts)
+
+def _render_sections(sections):
+    """Emit titled pill groups as one markdown block, skipping empty groups"""
+    parts = []
+    for title, items in sections:
+        if items:
+            parts.append(f"<div class='h3'>{html.escape(title)}</div>")
+            parts.append(_pills_html(items))
+    if parts:
+        st.markdown("".join(parts), unsafe_allow_html=True)
+
+def _render_table(rows, columns, threshold=20):
+    """Small tables as one escaped HTML block; st.dataframe only past the threshold"""
+    if len(rows) >= threshold:
+        st.dataframe(pd.DataFrame.from_records(rows, columns=columns), width='stretch')
+        return
+    parts = ["<table class='card'><thead><tr>"]
+    parts.extend("<th>" + html.escape(str(c)) + "</th>" for c in columns)
+    parts.append("</tr></thead><tbody>")
+    for row in rows:
+        parts.append("<tr>")
+        parts.extend("<td>" + html.escape(str(v)) + "</td>" for v in row)
+        parts.append("</tr>")
+    parts.append("</tbody></table>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
+def _hms(t):
+    """HH:MM:SS without strftime's locale-aware formatting path"""
+    return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}" if t else ""
 
 def render_workflow_status(state):
     """Render workflow processing status"""
@@ -78,41 +92,34 @@ def render_workflow_status(state):
 
     st.subheader("🔄 Workflow Status")
 
-    status_data = []
-    for stage_name, status in state.status.items():
-        status_class = f"status-{status.status}"
-        status_data.append({
-            "Stage": stage_name.replace("_", " ").title(),
-            "Status": status.status.title(),
-            "Message": status.message or "",
-            "Timestamp": status.timestamp.strftime("%H:%M:%S") if status.timestamp else ""
-        })
-
-    # Create status DataFrame
-    df = pd.DataFrame(status_data)
+    # Create status DataFrame column by column (stage count is small and fixed)
+    statuses = list(state.status.values())
+    df = pd.DataFrame({
+        "Stage": [name.replace("_", " ").title() for name in state.status],
+        "Status": [s.status.title() for s in statuses],
+        "Message": [s.message or "" for s in statuses],
+        "Timestamp": [_hms(s.timestamp) for s in statuses]
+    })
     st.dataframe(df, width='stretch')
 
     # Show errors and warnings
     if state.errors:
-        st.error("❌ **Errors:**")
-        for error in state.errors:
-            st.error(f"• {error}")
+        st.error("❌ **Errors:**\n\n" + "\n".join(f"- {error}" for error in state.errors))
 
     if state.warnings:
-        st.warning("⚠️ **Warnings:**")
-        for warning in state.warnings:
-            st.warning(f"• {warning}")
+        st.warning("⚠️ **Warnings:**\n\n" + "\n".join(f"- {warning}" for warning in state.warnings))
 
 def render_authentication_ui(auth_data):
     """Render authentication analysis results"""
     if not auth_data:
         return
 
-    _pills("Actors", auth_data.actors)
-    _pills("Auth Flows", auth_data.flows)
-    _pills("Threats", auth_data.threats)
-    if auth_data.idp_options:
-        _pills("Identity Providers", auth_data.idp_options)
+    _render_sections([
+        ("Actors", auth_data.actors),
+        ("Auth Flows", auth_data.flows),
+        ("Threats", auth_data.threats),
+        ("Identity Providers", auth_data.idp_options)
+    ])
 
 def render_integrations_ui(integrations_data):
     """Render integrations analysis results"""
@@ -120,20 +127,21 @@ def render_integrations_ui(integrations_data):
         st.info("No integrations found.")
         return
 
-    rows = []
-    for integration in integrations_data:
-        rows.append({
-            "System": integration.system,
-            "Purpose": integration.purpose,
-            "Protocol": integration.protocol,
-            "Auth": integration.auth,
-            "Endpoints": ", ".join(integration.endpoints),
-            "Inputs": ", ".join(integration.data_contract.get("inputs", [])),
-            "Outputs": ", ".join(integration.data_contract.get("outputs", []))
-        })
-
-    if rows:
-        st.dataframe(pd.DataFrame(rows), width='stretch')
+    _render_table(
+        [
+            (
+                integration.system,
+                integration.purpose,
+                integration.protocol,
+                integration.auth,
+                ", ".join(integration.endpoints),
+                ", ".join(integration.data_contract.get("inputs", [])),
+                ", ".join(integration.data_contract.get("outputs", []))
+            )
+            for integration in integrations_data
+        ],
+        ["System", "Purpose", "Protocol", "Auth", "Endpoints", "Inputs", "Outputs"]
+    )
 
 def render_entities_ui(entities_data):
     """Render domain entities"""
@@ -141,29 +149,21 @@ def render_entities_ui(entities_data):
         st.info("No entities found.")
         return
 
-    rows = []
-    for entity in entities_data:
-        rows.append({
-            "Entity": entity.name,
-            "Attributes Count": len(entity.attributes),
-            "Attributes": ", ".join(entity.attributes)
-        })
-
-    if rows:
-        st.dataframe(pd.DataFrame(rows), width='stretch')
-
-    # Entity details cards
-    st.markdown("<div class='h3'>Entity Details</div>", unsafe_allow_html=True)
-    st.markdown("<div class='grid'>", unsafe_allow_html=True)
+    _render_table(
+        [(entity.name, len(entity.attributes), ", ".join(entity.attributes)) for entity in entities_data],
+        ["Entity", "Attributes Count", "Attributes"]
+    )
+
+    # Entity details cards, emitted as one block so the grid wraps the cards
+    parts = ["<div class='h3'>Entity Details</div>", "<div class='grid'>"]
     for entity in entities_data:
-        st.markdown(
-            "<div class='card'><div style='font-weight:600;margin-bottom:6px'>"
-            + entity.name + "</div>"
-            + "<div class='pills'>" + "".join(f"<span class='pill'>{a}</span>" for a in entity.attributes) + "</div>"
-            + "</div>",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
+        parts.append("<div class='card'><div style='font-weight:600;margin-bottom:6px'>")
+        parts.append(html.escape(entity.name))
+        parts.append("</div>")
+        parts.append(_pills_html(entity.attributes))
+        parts.append("</div>")
+    parts.append("</div>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
 def render_apis_ui(apis_data):
     """Render API specifications"""
@@ -171,20 +171,18 @@ def render_apis_ui(apis_data):
         st.info("No APIs found.")
         return
 
-    rows = []
-    for api in apis_data:
-        req_fields = ", ".join(api.request.keys()) if api.request else "—"
-        res_fields = ", ".join(api.response.keys()) if api.response else "—"
-
-        rows.append({
-            "API": api.name,
-            "Description": api.description or "—",
-            "Request Fields": req_fields,
-            "Response Fields": res_fields
-        })
-
-    if rows:
-        st.dataframe(pd.DataFrame(rows), width='stretch')
+    _render_table(
+        [
+            (
+                api.name,
+                api.description or "—",
+                ", ".join(api.request.keys()) if api.request else "—",
+                ", ".join(api.response.keys()) if api.response else "—"
+            )
+            for api in apis_data
+        ],
+        ["API", "Description", "Request Fields", "Response Fields"]
+    )
 
 def render_use_cases_ui(use_cases):
     """Render use cases"""
@@ -212,19 +210,13 @@ def render_risks_ui(risks_data):
     if not risks_data:
         return
 
-    rows = []
-    for risk in risks_data:
-        rows.append({
-            "ID": risk.id,
-            "Description": risk.desc,
-            "Assumption": risk.assumption,
-            "Mitigation": risk.mitigation,
-            "Impact": risk.impact,
-            "Likelihood": risk.likelihood
-        })
-
-    if rows:
-        st.dataframe(pd.DataFrame(rows), width='stretch')
+    _render_table(
+        [
+            (risk.id, risk.desc, risk.assumption, risk.mitigation, risk.impact, risk.likelihood)
+            for risk in risks_data
+        ],
+        ["ID", "Description", "Assumption", "Mitigation", "Impact", "Likelihood"]
+    )
 
 def render_quality_score_ui(quality_score):
     """Render quality assessment results"""
@@ -263,40 +255,53 @@ def render_quality_score_ui(quality_score):
         for element in quality_score.missing_elements:
             st.warning(f"• {element}")
 
-def list_requirement_pdfs(folder: str = "data") -> List[str]:
-    """List available PDF files with detailed information"""
-    base = Path(folder)
-    if not base.exists():
-        base.mkdir(parents=True, exist_ok=True)
-        return []
-
-    pdf_files = []
-    for pdf_path in base.glob("*.pdf"):
-        # Only include actual PDF files (not .gitkeep or other files)
-        if pdf_path.is_file() and pdf_path.suffix.lower() == '.pdf':
-            pdf_files.append(str(pdf_path))
-
-    return sorted(pdf_files)
-
-def get_pdf_info(pdf_path: str) -> Dict[str, Any]:
-    """Get information about a PDF file"""
-    path = Path(pdf_path)
-    if not path.exists():
-        return {}
-
-    try:
-        stat = path.stat()
-        size_mb = stat.st_size / (1024 * 1024)
-        modified = datetime.fromtimestamp(stat.st_mtime)
-
-        return {
-            "name": path.name,
-            "size_mb": round(size_mb, 2),
-            "modified": modified.strftime("%Y-%m-%d %H:%M"),
-            "path": str(path)
-        }
-    except Exception:
-        return {"name": path.name, "path": str(path)}
+@st.cache_data(ttl=60)
+def list_pdf_infos(folder: str = "data") -> List[Dict[str, Any]]:
+    """Name, size and mtime of every available PDF from one scan (cached for 60s across reruns)"""
+    return pdf_discovery.list_pdf_infos(folder)
+
+@st.cache_resource
+def _get_workflow(workflow_type: str):
+    """Build the compiled workflow once per process for each workflow type"""
+    from workflow import create_hld_workflow
+    return create_hld_workflow(workflow_type)
+
+def _run_with_progress(workflow, workflow_input, progress_bar, status_placeholder):
+    """Run the workflow via its async stream, advancing the progress bar as each stage completes"""
+    stages = workflow.get_workflow_info()["nodes"]
+    completed = set()
+
+    def on_stage_complete(node_name):
+        if node_name not in stages:
+            return
+        completed.add(node_name)
+        progress_bar.progress(len(completed) / len(stages))
+        status_placeholder.info(f"Completed {node_name.replace('_', ' ').title()} ({len(completed)}/{len(stages)})")
+
+    return asyncio.run(workflow.arun(workflow_input, on_stage_complete))
+
+def _artifact_mtimes(paths) -> Dict[str, float]:
+    """mtime of each existing artifact, scanning every output folder once"""
+    wanted: Dict[str, Dict[str, str]] = {}
+    for path in paths:
+        if path:
+            wanted.setdefault(os.path.dirname(path), {})[os.path.basename(path)] = path
+
+    mtimes = {}
+    for folder, names in wanted.items():
+        try:
+            with os.scandir(folder or ".") as it:
+                for entry in it:
+                    if entry.name in names:
+                        mtimes[names[entry.name]] = entry.stat().st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+@st.cache_data(max_entries=8)
+def _load_artifact(path: str, mtime: float) -> bytes:
+    """Read a generated artifact; keyed on mtime so reruns reuse the bytes until the file changes"""
+    return Path(path).read_bytes()
 
 def render_ml_training_section():
     """Render ML training interface"""
@@ -590,6 +595,10 @@ def render_ml_inference_section():
 def main():
     """Main Streamlit application"""
     st.set_page_config(page_title="DesignMind GenAI - LangGraph", layout="wide")
+    # Emitted every run on purpose: Streamlit clears elements a rerun does not
+    # re-emit, so gating this on session_state would drop the styles after the
+    # first interaction
+    st.markdown(STYLES, unsafe_allow_html=True)
     st.title("🧠 DesignMind – LangGraph-Powered Architecture")
     st.caption("AI-driven High-Level Design generation with ML-based quality assessment. Three powerful workflows: Generate HLD, Train ML Models, and Predict Quality.")
 
@@ -599,9 +608,12 @@ def main():
     # ============ TAB 1: HLD GENERATION ============
     with tab1:
         # Quick overview of available PDFs
-        pdf_files = list_requirement_pdfs()
+        Path("data").mkdir(parents=True, exist_ok=True)
+        pdf_infos = list_pdf_infos()
+        info_by_name = {info["name"]: info for info in pdf_infos}
+        pdf_files = [info["path"] for info in pdf_infos]
         if pdf_files:
-            st.success(f"🎉 **Ready to go!** Found {len(pdf_files)} requirement documents: {', '.join([Path(p).name for p in pdf_files[:3]])}{'...' if len(pdf_files) > 3 else ''}")
+            st.success(f"🎉 **Ready to go!** Found {len(pdf_files)} requirement documents: {', '.join(list(info_by_name)[:3])}{'...' if len(pdf_files) > 3 else ''}")
         else:
             st.warning("🚨 **No PDF files found!** Please upload requirement documents to the `data/` folder first.")
             st.info("📚 **Expected files:** Requirement-1.pdf, Banking-System-PRD.pdf, E-commerce-Requirements.pdf, etc.")
@@ -616,7 +628,7 @@ def main():
                 "Workflow Type",
                 ["sequential", "parallel", "conditional"],
                 index=0,
-                help="Sequential: One stage at a time (most reliable). Parallel: Optimized sequential execution. Conditional: Smart routing based on state."
+                help="Sequential: One stage at a time (most reliable). Parallel: Auth, domain and behavior analysis run concurrently. Conditional: Smart routing based on state."
             )
 
             # Diagram configuration
@@ -631,7 +643,7 @@ def main():
 
         with left:
             st.subheader("📄 Select Requirements Document")
-            file_names = [Path(p).name for p in pdf_files]
+            file_names = list(info_by_name)
             options = ["— Select a requirements file —"] + file_names
             selected_label = st.selectbox(
                 "Choose a PDF document to analyze:",
@@ -653,38 +665,24 @@ def main():
 
             # Show PDF file details
             with st.expander("📋 View All PDF Details", expanded=False):
-                pdf_data = []
-                total_size = 0
-                for pdf_path in pdf_files:
-                    info = get_pdf_info(pdf_path)
-                    if info:
-                        size_mb = info.get("size_mb", 0)
-                        total_size += size_mb if isinstance(size_mb, (int, float)) else 0
-                        pdf_data.append({
-                            "File": info["name"],
-                            "Size (MB)": size_mb,
-                            "Modified": info.get("modified", "N/A")
-                        })
+                pdf_data = [
+                    (info["name"], info.get("size_mb", "N/A"), info.get("modified", "N/A"))
+                    for info in pdf_infos
+                ]
+                total_size = sum(size for _, size, _ in pdf_data if isinstance(size, (int, float)))
 
                 if pdf_data:
                     st.caption(f"Total size: {round(total_size, 2)} MB")
-                    df = pd.DataFrame(pdf_data)
+                    df = pd.DataFrame.from_records(pdf_data, columns=["File", "Size (MB)", "Modified"])
                     st.dataframe(df, width='stretch', hide_index=True)
 
         # Get selected PDF path and show file info
-        selected_path = None
-        if selected_label != "— Select a requirements file —":
-            try:
-                selected_index = file_names.index(selected_label)
-                selected_path = pdf_files[selected_index]
-
-                # Show selected file information
-                if selected_path:
-                    info = get_pdf_info(selected_path)
-                    if info:
-                        st.success(f"📄 **Selected:** {info['name']} ({info.get('size_mb', 'N/A')} MB, modified {info.get('modified', 'N/A')})")
-            except ValueError:
-                selected_path = None
+        info = info_by_name.get(selected_label)
+        selected_path = info["path"] if info else None
+
+        # Show selected file information
+        if info:
+            st.success(f"📄 **Selected:** {info['name']} ({info.get('size_mb', 'N/A')} MB, modified {info.get('modified', 'N/A')})")
 
         # Generate HLD button
         st.divider()
@@ -704,6 +702,8 @@ def main():
                 st.warning("Please choose a requirements PDF.")
                 st.stop()
 
+            from state.schema import WorkflowInput, ConfigSchema
+
             # Create configuration
             config = ConfigSchema(
                 render_images=render_images,
@@ -719,7 +719,7 @@ def main():
             )
 
             # Create and run workflow
-            workflow = create_hld_workflow(workflow_type)
+            workflow = _get_workflow(workflow_type)
 
             # Progress tracking
             progress_bar = st.progress(0)
@@ -727,8 +727,8 @@ def main():
 
             with st.spinner(f"🔄 Running {workflow_type} workflow..."):
                 try:
-                    # Run workflow
-                    result = workflow.run(workflow_input)
+                    # Run workflow, streaming per-stage progress
+                    result = _run_with_progress(workflow, workflow_input, progress_bar, status_placeholder)
 
                     progress_bar.progress(100)
 
@@ -745,51 +745,63 @@ def main():
                         # Extracted requirements
                         if state.extracted:
                             st.header("📋 Extracted Requirements")
+                            md = state.extracted.markdown
+                            truncated = len(md) > 5000
                             with st.expander("View extracted content", expanded=False):
-                                st.code(state.extracted.markdown[:5000] + "..." if len(state.extracted.markdown) > 5000 else state.extracted.markdown)
+                                st.code(md[:5000] + "…" if truncated else md, language="markdown")
+                            if truncated:
+                                # Served on click instead of rendered into the page
+                                st.download_button(
+                                    "📄 Download full extracted content",
+                                    data=md,
+                                    file_name=f"{state.requirement_name or 'requirements'}.md",
+                                    mime="text/markdown"
+                                )
 
                         # Authentication
                         if state.authentication:
-                            st.header("🔐 Authentication")
-                            render_authentication_ui(state.authentication)
+                            with st.expander("🔐 Authentication", expanded=False):
+                                render_authentication_ui(state.authentication)
 
                         # Integrations
                         if state.integrations:
-                            st.header("🔗 Integrations")
-                            render_integrations_ui(state.integrations)
+                            with st.expander("🔗 Integrations", expanded=False):
+                                render_integrations_ui(state.integrations)
 
                         # Domain entities
                         if state.domain and state.domain.entities:
-                            st.header("🏗️ Domain Entities")
-                            render_entities_ui(state.domain.entities)
+                            with st.expander("🏗️ Domain Entities", expanded=False):
+                                render_entities_ui(state.domain.entities)
 
                         # APIs
                         if state.domain and state.domain.apis:
-                            st.header("🔌 APIs")
-                            render_apis_ui(state.domain.apis)
+                            with st.expander("🔌 APIs", expanded=False):
+                                render_apis_ui(state.domain.apis)
 
                         # Use cases
                         if state.behavior and state.behavior.use_cases:
-                            st.header("📝 Use Cases")
-                            render_use_cases_ui(state.behavior.use_cases)
+                            with st.expander("📝 Use Cases", expanded=False):
+                                render_use_cases_ui(state.behavior.use_cases)
 
                         # NFRs
                         if state.behavior and state.behavior.nfrs:
-                            st.header("⚡ Non-Functional Requirements")
-                            render_nfrs_ui(state.behavior.nfrs)
+                            with st.expander("⚡ Non-Functional Requirements", expanded=False):
+                                render_nfrs_ui(state.behavior.nfrs)
 
                         # Risks
                         if state.behavior and state.behavior.risks:
-                            st.header("⚠️ Risks & Assumptions")
-                            render_risks_ui(state.behavior.risks)
+                            with st.expander("⚠️ Risks & Assumptions", expanded=False):
+                                render_risks_ui(state.behavior.risks)
 
                         # Risk heatmap
                         if result.output_paths.get("risk_heatmap"):
-                            st.header("🎯 Risk Heatmap")
-                            st.image(result.output_paths["risk_heatmap"], caption="Impact × Likelihood (1..5)")
+                            with st.expander("🎯 Risk Heatmap", expanded=False):
+                                st.image(result.output_paths["risk_heatmap"], caption="Impact × Likelihood (1..5)")
 
                         # Diagrams
                         if state.diagrams:
+                            from diagram_publisher import render_mermaid_inline
+
                             st.header("📊 Diagrams")
 
                             # Class diagram
@@ -800,44 +812,52 @@ def main():
                             # Sequence diagrams
                             if state.diagrams.sequence_texts:
                                 st.subheader("🔄 Sequence Diagrams")
-                                for i, seq_text in enumerate(state.diagrams.sequence_texts, 1):
-                                    st.markdown(f"**Sequence #{i}**")
-                                    render_mermaid_inline(seq_text, key=f"seq-{i}", height=460, theme=theme)
+                                # Only the first diagram is shown open; the rest are still
+                                # rendered on every run, just collapsed into expanders
+                                first_seq, *other_seqs = state.diagrams.sequence_texts
+                                st.markdown("**Sequence #1**")
+                                render_mermaid_inline(first_seq, key="seq-1", height=460, theme=theme)
+                                for i, seq_text in enumerate(other_seqs, 2):
+                                    with st.expander(f"Sequence #{i}", expanded=False):
+                                        render_mermaid_inline(seq_text, key=f"seq-{i}", height=460, theme=theme)
 
                         # Download section
                         st.header("💾 Downloads")
 
+                        artifacts = _artifact_mtimes(
+                            result.output_paths.get(key) for key in ("hld_md", "hld_html", "diagrams_html")
+                        )
                         col1, col2, col3 = st.columns(3)
 
                         with col1:
-                            if result.output_paths.get("hld_md"):
-                                with open(result.output_paths["hld_md"], "rb") as f:
-                                    st.download_button(
-                                        "📄 Download HLD.md",
-                                        data=f,
-                                        file_name="HLD.md",
-                                        mime="text/markdown"
-                                    )
+                            artifact = result.output_paths.get("hld_md")
+                            if artifact in artifacts:
+                                st.download_button(
+                                    "📄 Download HLD.md",
+                                    data=_load_artifact(artifact, artifacts[artifact]),
+                                    file_name="HLD.md",
+                                    mime="text/markdown"
+                                )
 
                         with col2:
-                            if result.output_paths.get("hld_html"):
-                                with open(result.output_paths["hld_html"], "rb") as f:
-                                    st.download_button(
-                                        "🌐 Download HLD.html",
-                                        data=f,
-                                        file_name="HLD.html",
-                                        mime="text/html"
-                                    )
+                            artifact = result.output_paths.get("hld_html")
+                            if artifact in artifacts:
+                                st.download_button(
+                                    "🌐 Download HLD.html",
+                                    data=_load_artifact(artifact, artifacts[artifact]),
+                                    file_name="HLD.html",
+                                    mime="text/html"
+                                )
 
                         with col3:
-                            if result.output_paths.get("diagrams_html"):
-                                with open(result.output_paths["diagrams_html"], "rb") as f:
-                                    st.download_button(
-                                        "📊 Download Diagrams.html",
-                                        data=f,
-                                        file_name="Diagrams.html",
-                                        mime="text/html"
-                                    )
+                            artifact = result.output_paths.get("diagrams_html")
+                            if artifact in artifacts:
+                                st.download_button(
+                                    "📊 Download Diagrams.html",
+                                    data=_load_artifact(artifact, artifacts[artifact]),
+                                    file_name="Diagrams.html",
+                                    mime="text/html"
+                                )
 
                         # Output info
                         if state.output:
@@ -847,14 +867,10 @@ def main():
 
                     else:
                         status_placeholder.error("❌ HLD generation failed")
-                        st.error("**Errors:**")
-                        for error in result.errors:
-                            st.error(f"• {error}")
+                        st.error("**Errors:**\n\n" + "\n".join(f"- {error}" for error in result.errors))
 
                         if result.warnings:
-                            st.warning("**Warnings:**")
-                            for warning in result.warnings:
-                                st.warning(f"• {warning}")
+                            st.warning("**Warnings:**\n\n" + "\n".join(f"- {warning}" for warning in result.warnings))
 
                 except Exception as e:
                     progress_bar.progress(0)
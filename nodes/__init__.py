@@ -3,22 +3,24 @@ Workflow Nodes Package
 Contains individual node definitions for the HLD generation workflow
 """
 
-from .base_node import BaseNode
+from .base_node import BaseNode, AgentNode
 from .pdf_extraction_node import PDFExtractionNode
 from .auth_integrations_node import AuthIntegrationsNode
 from .domain_api_node import DomainAPINode
 from .behavior_quality_node import BehaviorQualityNode
 from .diagram_generation_node import DiagramGenerationNode
 from .output_composition_node import OutputCompositionNode
-from .node_manager import NodeManager
+from .node_manager import NodeManager, get_node_manager
 
 __all__ = [
     "BaseNode",
+    "AgentNode",
     "PDFExtractionNode",
     "AuthIntegrationsNode",
     "DomainAPINode",
     "BehaviorQualityNode",
     "DiagramGenerationNode",
     "OutputCompositionNode",
-    "NodeManager"
+    "NodeManager",
+    "get_node_manager"
 ]
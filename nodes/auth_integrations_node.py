@@ -3,15 +3,14 @@ Authentication and Integrations Node
 Handles analysis of authentication mechanisms and integrations
 """
 
-from typing import Any
-from state.models import HLDState
-from agent import AuthIntegrationsAgent
-from .base_node import BaseNode
+from .base_node import AgentNode
 
 
-class AuthIntegrationsNode(BaseNode):
+class AuthIntegrationsNode(AgentNode):
     """Node for analyzing authentication mechanisms and integrations"""
 
+    output_fields = ("authentication", "integrations")
+
     def __init__(self):
         """Initialize authentication and integrations node"""
         super().__init__(
@@ -19,16 +18,8 @@ class AuthIntegrationsNode(BaseNode):
             description="Analyze authentication mechanisms and integrations",
             critical=False
         )
-        self.agent = AuthIntegrationsAgent()
-
-    def execute_logic(self, hld_state: HLDState) -> Any:
-        """
-        Execute authentication and integrations analysis
-
-        Args:
-            hld_state: Current workflow state
 
-        Returns:
-            Authentication and integration analysis results
-        """
-        return self.agent.process(hld_state)
+    def create_agent(self):
+        """Build the AuthIntegrationsAgent"""
+        from agent import AuthIntegrationsAgent
+        return AuthIntegrationsAgent()
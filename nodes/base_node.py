@@ -4,8 +4,8 @@ Provides common functionality for all workflow nodes
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from langchain_core.runnables import RunnableLambda
+from functools import cached_property
+from typing import Dict, Any, Optional, Tuple, Callable
 
 from state.models import HLDState
 
@@ -13,6 +13,9 @@ from state.models import HLDState
 class BaseNode(ABC):
     """Abstract base class for all workflow nodes"""
 
+    # Top-level HLDState fields the node's logic assigns (see execute_update)
+    output_fields: Tuple[str, ...] = ()
+
     def __init__(self, name: str, description: str = "", critical: bool = False):
         """
         Initialize the base node
@@ -52,10 +55,12 @@ class BaseNode(ABC):
             Updated state dictionary
         """
         try:
-            hld_state = HLDState(**state)
+            hld_state = HLDState.model_validate(state)
             result = self.execute_logic(hld_state)
 
-            updated_state = hld_state.dict()
+            # Shallow copy: nested models pass through as instances, which
+            # the next node's model_validate accepts without revalidating
+            updated_state = dict(hld_state)
             updated_state["_node_result"] = result
             updated_state["_last_executed_node"] = self.name
 
@@ -68,9 +73,49 @@ class BaseNode(ABC):
             self.last_error = str(e)
             raise
 
-    def get_runnable(self) -> RunnableLambda:
-        """Get the node as a RunnableLambda for LangGraph"""
-        return RunnableLambda(self.execute)
+    def execute_update(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the node and return only what it changed
+
+        For graphs on ParallelHLDState, where concurrent branches merge
+        their writes through reducers instead of replacing the whole state
+
+        Args:
+            state: Current workflow state dictionary
+
+        Returns:
+            Partial state: this node's status entry, new errors and
+            warnings, and its output_fields
+        """
+        try:
+            hld_state = HLDState.model_validate(state)
+            errors_before = len(hld_state.errors)
+            warnings_before = len(hld_state.warnings)
+            self.execute_logic(hld_state)
+
+            update = {field: getattr(hld_state, field) for field in self.output_fields}
+            if self.name in hld_state.status:
+                update["status"] = {self.name: hld_state.status[self.name]}
+            update["errors"] = hld_state.errors[errors_before:]
+            update["warnings"] = hld_state.warnings[warnings_before:]
+            update["updated_at"] = hld_state.updated_at
+
+            self.status = "completed"
+            self.last_error = None
+
+            return update
+        except Exception as e:
+            self.status = "failed"
+            self.last_error = str(e)
+            raise
+
+    def get_runnable(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Get the node as a plain callable for LangGraph's add_node"""
+        return self.execute
+
+    def get_update_runnable(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Get the node's partial-update form as a plain callable for LangGraph's add_node"""
+        return self.execute_update
 
     def get_info(self) -> Dict[str, Any]:
         """Get node information"""
@@ -81,3 +126,29 @@ class BaseNode(ABC):
             "status": self.status,
             "last_error": self.last_error
         }
+
+
+class AgentNode(BaseNode):
+    """Base class for nodes whose logic is a single agent's process() call"""
+
+    @abstractmethod
+    def create_agent(self):
+        """Build the node's agent; subclasses import the agent module here"""
+        pass
+
+    @cached_property
+    def agent(self):
+        """The node's agent, built on first use so unvisited nodes never pay for it"""
+        return self.create_agent()
+
+    def execute_logic(self, hld_state: HLDState) -> Any:
+        """
+        Delegate to the node's agent
+
+        Args:
+            hld_state: Current workflow state
+
+        Returns:
+            Result of the agent's process() call
+        """
+        return self.agent.process(hld_state)
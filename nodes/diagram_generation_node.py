@@ -3,15 +3,14 @@ Diagram Generation Node
 Handles visual diagram and representation generation
 """
 
-from typing import Any
-from state.models import HLDState
-from agent import DiagramAgent
-from .base_node import BaseNode
+from .base_node import AgentNode
 
 
-class DiagramGenerationNode(BaseNode):
+class DiagramGenerationNode(AgentNode):
     """Node for diagram and visual representation generation"""
 
+    output_fields = ("diagrams",)
+
     def __init__(self):
         """Initialize diagram generation node"""
         super().__init__(
@@ -19,16 +18,8 @@ class DiagramGenerationNode(BaseNode):
             description="Generate visual diagrams and representations",
             critical=False
         )
-        self.agent = DiagramAgent()
-
-    def execute_logic(self, hld_state: HLDState) -> Any:
-        """
-        Execute diagram generation logic
-
-        Args:
-            hld_state: Current workflow state
 
-        Returns:
-            Generated diagrams and visual representations
-        """
-        return self.agent.process(hld_state)
+    def create_agent(self):
+        """Build the DiagramAgent"""
+        from agent import DiagramAgent
+        return DiagramAgent()
@@ -3,15 +3,14 @@ Domain and API Design Node
 Handles domain model and API interface design
 """
 
-from typing import Any
-from state.models import HLDState
-from agent import DomainAPIAgent
-from .base_node import BaseNode
+from .base_node import AgentNode
 
 
-class DomainAPINode(BaseNode):
+class DomainAPINode(AgentNode):
     """Node for domain model and API design"""
 
+    output_fields = ("domain",)
+
     def __init__(self):
         """Initialize domain and API design node"""
         super().__init__(
@@ -19,16 +18,8 @@ class DomainAPINode(BaseNode):
             description="Design domain models and API interfaces",
             critical=False
         )
-        self.agent = DomainAPIAgent()
-
-    def execute_logic(self, hld_state: HLDState) -> Any:
-        """
-        Execute domain and API design logic
-
-        Args:
-            hld_state: Current workflow state
 
-        Returns:
-            Domain model and API design results
-        """
-        return self.agent.process(hld_state)
+    def create_agent(self):
+        """Build the DomainAPIAgent"""
+        from agent import DomainAPIAgent
+        return DomainAPIAgent()
@@ -3,8 +3,8 @@ Node Manager
 Manages all workflow nodes and provides utilities for node operations
 """
 
-from typing import Dict, Any, List
-from langchain_core.runnables import RunnableLambda
+from functools import lru_cache
+from typing import Dict, Any, List, Callable
 
 from .pdf_extraction_node import PDFExtractionNode
 from .auth_integrations_node import AuthIntegrationsNode
@@ -18,6 +18,8 @@ from state.models import HLDState
 class NodeManager:
     """Manages all workflow nodes"""
 
+    __slots__ = ("nodes", "_runnables", "_update_runnables")
+
     # Node definitions with metadata
     NODE_DEFINITIONS = {
         "pdf_extraction": {
@@ -72,6 +74,15 @@ class NodeManager:
             "diagram_generation": DiagramGenerationNode(),
             "output_composition": OutputCompositionNode()
         }
+        # Resolve each node's entry point once; every graph built from this manager reuses them
+        self._runnables = {
+            node_name: node.get_runnable()
+            for node_name, node in self.nodes.items()
+        }
+        self._update_runnables = {
+            node_name: node.get_update_runnable()
+            for node_name, node in self.nodes.items()
+        }
 
     def get_node(self, node_name: str):
         """Get a node by name"""
@@ -83,12 +94,13 @@ class NodeManager:
         """Get all nodes"""
         return self.nodes
 
-    def get_node_runnables(self) -> Dict[str, RunnableLambda]:
-        """Get all nodes as RunnableLambda objects for LangGraph"""
-        return {
-            node_name: node.get_runnable()
-            for node_name, node in self.nodes.items()
-        }
+    def get_node_runnables(self) -> Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """Get all nodes as callables for LangGraph"""
+        return self._runnables
+
+    def get_node_update_runnables(self) -> Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """Get all nodes in partial-update form, for graphs with reducer state"""
+        return self._update_runnables
 
     def get_nodes_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all nodes"""
@@ -142,3 +154,9 @@ class NodeManager:
         for node in self.nodes.values():
             node.status = "pending"
             node.last_error = None
+
+
+@lru_cache(maxsize=1)
+def get_node_manager() -> NodeManager:
+    """Process-wide NodeManager shared by every workflow graph"""
+    return NodeManager()
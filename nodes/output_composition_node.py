@@ -3,15 +3,14 @@ Output Composition Node
 Handles composition and formatting of final output
 """
 
-from typing import Any
-from state.models import HLDState
-from agent import OutputAgent
-from .base_node import BaseNode
+from .base_node import AgentNode
 
 
-class OutputCompositionNode(BaseNode):
+class OutputCompositionNode(AgentNode):
     """Node for final output composition and formatting"""
 
+    output_fields = ("output",)
+
     def __init__(self):
         """Initialize output composition node"""
         super().__init__(
@@ -19,16 +18,8 @@ class OutputCompositionNode(BaseNode):
             description="Compose and format final output",
             critical=False
         )
-        self.agent = OutputAgent()
-
-    def execute_logic(self, hld_state: HLDState) -> Any:
-        """
-        Execute output composition logic
-
-        Args:
-            hld_state: Current workflow state
 
-        Returns:
-            Composed and formatted final output
-        """
-        return self.agent.process(hld_state)
+    def create_agent(self):
+        """Build the OutputAgent"""
+        from agent import OutputAgent
+        return OutputAgent()
@@ -3,15 +3,14 @@ PDF Extraction Node
 Handles PDF document extraction and parsing
 """
 
-from typing import Any
-from state.models import HLDState
-from agent import PDFExtractionAgent
-from .base_node import BaseNode
+from .base_node import AgentNode
 
 
-class PDFExtractionNode(BaseNode):
+class PDFExtractionNode(AgentNode):
     """Node for PDF extraction and parsing"""
 
+    output_fields = ("extracted",)
+
     def __init__(self):
         """Initialize PDF extraction node"""
         super().__init__(
@@ -19,16 +18,8 @@ class PDFExtractionNode(BaseNode):
             description="Extract and parse content from PDF documents",
             critical=True
         )
-        self.agent = PDFExtractionAgent()
-
-    def execute_logic(self, hld_state: HLDState) -> Any:
-        """
-        Execute PDF extraction logic
-
-        Args:
-            hld_state: Current workflow state
 
-        Returns:
-            Extracted PDF content and metadata
-        """
-        return self.agent.process(hld_state)
+    def create_agent(self):
+        """Build the PDFExtractionAgent"""
+        from agent import PDFExtractionAgent
+        return PDFExtractionAgent()
@@ -3,7 +3,7 @@ LangGraph State Models for HLD Generation
 """
 
 from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from pathlib import Path
 
@@ -94,6 +94,10 @@ class OutputData(BaseModel):
 class HLDState(BaseModel):
     """Main LangGraph state for HLD generation workflow"""
     
+    # Graph dicts carry routing keys (_node_result, ...) that are not fields;
+    # agents mutate the state in place, so assignments stay unvalidated
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     # Input
     pdf_path: str = ""
     requirement_name: str = ""
@@ -2,7 +2,9 @@
 Schema definitions and validation for HLD generation
 """
 
-from typing import Dict, List, Optional, Any, Union
+import operator
+import os
+from typing import Dict, List, Optional, Any, Union, Annotated, TypedDict
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
@@ -66,6 +68,34 @@ class WorkflowOutput(BaseModel):
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
 
+def _latest(left: datetime, right: datetime) -> datetime:
+    """Reducer keeping the most recent timestamp"""
+    return max(left, right)
+
+class ParallelHLDState(TypedDict, total=False):
+    """
+    Graph state for workflows whose nodes run concurrently
+
+    Mirrors HLDState field for field. Fields several branches touch carry
+    a reducer so their writes merge; each stage's results go to a field
+    only that stage writes.
+    """
+    pdf_path: str
+    requirement_name: str
+    config: Dict[str, Any]
+    status: Annotated[Dict[str, ProcessingStatus], operator.or_]
+    extracted: Optional[ExtractedContent]
+    authentication: Optional[AuthenticationData]
+    integrations: List[IntegrationData]
+    domain: Optional[DomainData]
+    behavior: Optional[BehaviorData]
+    diagrams: Optional[DiagramData]
+    output: Optional[OutputData]
+    errors: Annotated[List[str], operator.add]
+    warnings: Annotated[List[str], operator.add]
+    created_at: datetime
+    updated_at: Annotated[datetime, _latest]
+
 # Type aliases for better readability
 StateDict = Dict[str, Any]
 NodeResult = Dict[str, Any]
@@ -93,13 +123,12 @@ DEFAULT_CONFIG = ConfigSchema()
 
 def validate_state(state: Dict[str, Any]) -> HLDState:
     """Validate and convert dict to HLDState"""
-    return HLDState(**state)
+    return HLDState.model_validate(state)
 
 def create_initial_state(pdf_path: str, config: ConfigSchema) -> HLDState:
     """Create initial state for workflow"""
-    from pathlib import Path
-    
-    requirement_name = Path(pdf_path).stem
+    # basename/splitext give Path(pdf_path).stem without building a PurePath
+    requirement_name = os.path.splitext(os.path.basename(pdf_path))[0]
     
     return HLDState(
         pdf_path=pdf_path,
@@ -3,14 +3,70 @@ Comprehensive Test Suite for DesignMind GenAI LangGraph System
 Includes tests for workflow, state management, agents, ML models, and utilities
 """
 
+import os
 import pytest
 import json
 import tempfile
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 import numpy as np
 
+from agent import (
+    PDFExtractionAgent,
+    AuthIntegrationsAgent,
+    DomainAPIAgent,
+    BehaviorQualityAgent,
+)
+
+AGENTS = [
+    (PDFExtractionAgent, "GEMINI_API_KEY_4"),
+    (AuthIntegrationsAgent, "GEMINI_API_KEY_1"),
+    (DomainAPIAgent, "GEMINI_API_KEY_3"),
+    (BehaviorQualityAgent, "GEMINI_API_KEY_2"),
+]
+
+# Canned LLM payloads, serialized once at import
+_PDF_RESPONSE_JSON = json.dumps({
+    "markdown": "# Test Requirements\nUsers can sign in.",
+    "meta": {"title": "Test Requirements", "version": "1.0", "date": "2025-01"}
+})
+
+
+class _StubAgent:
+    """Stands in for a node's agent: fills one state field and marks the stage done"""
+
+    def __init__(self, stage, field, value, warning=None):
+        self.stage, self.field, self.value, self.warning = stage, field, value, warning
+
+    def process(self, state):
+        setattr(state, self.field, self.value)
+        if self.warning:
+            state.add_warning(self.warning)
+        state.update_status(self.stage, "completed")
+        return {"success": True}
+
+
+def _stub_agents():
+    """One _StubAgent per workflow stage; two of the parallel branches warn"""
+    from state.models import (
+        ExtractedContent, AuthenticationData, DomainData, EntityData,
+        BehaviorData, DiagramData, OutputData,
+    )
+
+    return {
+        "pdf_extraction": _StubAgent("pdf_extraction", "extracted", ExtractedContent(markdown="# Test")),
+        "auth_integrations": _StubAgent("auth_integrations", "authentication",
+                                        AuthenticationData(actors=["User"]), warning="auth warning"),
+        "domain_api_design": _StubAgent("domain_api_design", "domain",
+                                        DomainData(entities=[EntityData(name="User")])),
+        "behavior_quality": _StubAgent("behavior_quality", "behavior",
+                                       BehaviorData(use_cases=["Sign in"]), warning="behavior warning"),
+        "diagram_generation": _StubAgent("diagram_generation", "diagrams", DiagramData(class_text="classDiagram")),
+        "output_composition": _StubAgent("output_composition", "output", OutputData(requirement_name="test")),
+    }
+
 # ============================================================================
 # TEST 1: State Management and Models
 # ============================================================================
@@ -52,6 +108,18 @@ class TestConfigurationSchema:
         assert config.renderer == "kroki"
         assert config.theme == "default"
 
+    @pytest.mark.parametrize("kwargs", [
+        {"image_format": "invalid"},
+        {"renderer": "invalid"},
+        {"theme": "invalid"},
+    ])
+    def test_config_schema_rejects(self, kwargs):
+        """Test configuration schema rejects unsupported values"""
+        from state.schema import ConfigSchema
+
+        with pytest.raises(ValueError):
+            ConfigSchema(**kwargs)
+
 
 # ============================================================================
 # TEST 3: Workflow Creation and Types
@@ -59,17 +127,71 @@ class TestConfigurationSchema:
 class TestWorkflowCreation:
     """Test 3: Workflow creation with different execution modes"""
 
-    def test_workflow_types_creation(self):
+    def test_workflow_types_creation(self, workflows):
         """Test creation of different workflow types"""
-        from workflow import create_hld_workflow
-
-        sequential = create_hld_workflow("sequential")
-        parallel = create_hld_workflow("parallel")
-        conditional = create_hld_workflow("conditional")
+        for workflow_type, workflow in workflows.items():
+            assert workflow is not None
+            assert workflow.workflow_type == workflow_type
+            assert workflow.graph is not None
+
+    def test_workflow_info(self, workflows):
+        """Test workflow info reports type and parallel support"""
+        for workflow_type, workflow in workflows.items():
+            info = workflow.get_workflow_info()
+            assert info["workflow_type"] == workflow_type
+            assert len(info["nodes"]) == 6
+            assert info["supports_parallel"] is (workflow_type != "sequential")
+
+    def test_parallel_graph_fans_out(self, workflows):
+        """Test the parallel workflow branches the analysis stages off extraction"""
+        edges = {(e.source, e.target) for e in workflows["parallel"].graph.get_graph().edges}
+
+        for stage in ("auth_integrations", "domain_api_design", "behavior_quality"):
+            assert ("pdf_extraction", stage) in edges
+            assert (stage, "diagram_generation") in edges
+
+    def test_parallel_workflow_run(self, workflows, default_config, stubbed_nodes):
+        """Test the parallel branches' statuses, warnings and outputs all reach the final state"""
+        from state.schema import WorkflowInput
+
+        result = workflows["parallel"].run(WorkflowInput(pdf_path="test.pdf", config=default_config))
+
+        state = result.state
+        assert result.success is True
+        assert {s.status for s in state.status.values()} == {"completed"}
+        assert len(state.status) == 6
+        assert {"auth warning", "behavior warning"} <= set(state.warnings)
+        assert state.authentication.actors == ["User"]
+        assert state.domain.entities[0].name == "User"
+        assert state.behavior.use_cases == ["Sign in"]
+
+    @pytest.mark.parametrize("workflow_type", ["sequential", "parallel", "conditional"])
+    def test_arun_reports_stage_progress(self, workflows, default_config, stubbed_nodes, workflow_type):
+        """Test arun's progress callback sees every node and the result matches run()"""
+        import asyncio
+        from state.schema import WorkflowInput
+
+        workflow = workflows[workflow_type]
+        workflow_input = WorkflowInput(pdf_path="test.pdf", config=default_config)
+        completed = []
+
+        result = asyncio.run(workflow.arun(workflow_input, completed.append))
+        expected = workflow.run(workflow_input)
+
+        assert set(completed) == set(workflow.get_workflow_info()["nodes"])
+        assert result.success is expected.success is True
+        assert result.errors == expected.errors
+        assert sorted(result.warnings) == sorted(expected.warnings)
+        assert result.output_paths == expected.output_paths
+        for field in ("extracted", "authentication", "domain", "behavior", "diagrams", "output"):
+            assert getattr(result.state, field) == getattr(expected.state, field)
+
+    def test_parallel_state_mirrors_hld_state(self):
+        """Test ParallelHLDState declares every HLDState field, so none is dropped"""
+        from state.models import HLDState
+        from state.schema import ParallelHLDState
 
-        assert sequential is not None
-        assert parallel is not None
-        assert conditional is not None
+        assert set(ParallelHLDState.__annotations__) == set(HLDState.model_fields)
 
 
 # ============================================================================
@@ -278,20 +400,17 @@ class TestMLIntegration:
 
     def test_ml_modules_import(self):
         """Test that all ML modules can be imported successfully"""
-        try:
-            from ml.training.generate_dataset import SyntheticDatasetGenerator
-            from ml.training.train_large_model import LargeScaleMLTrainer
-            from ml.training.inference import HLDQualityPredictor
-            from ml.models.feature_extractor import FeatureExtractor
-            from ml.models.quality_scorer import RuleBasedQualityScorer
-
-            assert SyntheticDatasetGenerator is not None
-            assert LargeScaleMLTrainer is not None
-            assert HLDQualityPredictor is not None
-            assert FeatureExtractor is not None
-            assert RuleBasedQualityScorer is not None
-        except ImportError as e:
-            pytest.fail(f"ML module import failed: {e}")
+        from ml.training.generate_dataset import SyntheticDatasetGenerator
+        from ml.training.train_large_model import LargeScaleMLTrainer
+        from ml.training.inference import HLDQualityPredictor
+        from ml.models.feature_extractor import FeatureExtractor
+        from ml.models.quality_scorer import RuleBasedQualityScorer
+
+        assert SyntheticDatasetGenerator is not None
+        assert LargeScaleMLTrainer is not None
+        assert HLDQualityPredictor is not None
+        assert FeatureExtractor is not None
+        assert RuleBasedQualityScorer is not None
 
 
 class TestUtilityFunctions:
@@ -299,18 +418,130 @@ class TestUtilityFunctions:
 
     def test_utility_imports(self):
         """Test that all utility modules can be imported"""
-        try:
-            from utils.diagram_converter import diagram_plan_to_text
-            from utils.diagram_renderer import render_diagrams
-            from utils.compose_output import hld_to_markdown
-            from utils.risk_heatmap import generate_risk_heatmap
+        from utils.diagram_converter import diagram_plan_to_text
+        from utils.diagram_renderer import render_diagrams
+        from utils.compose_output import hld_to_markdown
+        from utils.risk_heatmap import generate_risk_heatmap
+
+        assert diagram_plan_to_text is not None
+        assert render_diagrams is not None
+        assert hld_to_markdown is not None
+        assert generate_risk_heatmap is not None
+
+    def test_pdf_discovery_skips_hidden_files(self, tmp_path):
+        """Test PDF listing matches .PDF and skips hidden and non-PDF entries"""
+        from utils.pdf_discovery import list_requirement_pdfs, list_pdf_infos
+
+        for name in ("b.pdf", "A.PDF", "._x.pdf", ".DS_Store", "notes.txt"):
+            (tmp_path / name).write_bytes(b"%PDF-1.4")
+        (tmp_path / "dir.pdf").mkdir()
+
+        assert list_requirement_pdfs(str(tmp_path)) == [
+            str(tmp_path / "A.PDF"), str(tmp_path / "b.pdf")
+        ]
+        assert [info["name"] for info in list_pdf_infos(str(tmp_path))] == ["A.PDF", "b.pdf"]
+
+    def test_pdf_discovery_missing_folder(self, tmp_path):
+        """Test a missing folder lists no PDFs instead of raising"""
+        from utils.pdf_discovery import list_requirement_pdfs, list_pdf_infos, get_pdf_info
+
+        missing = tmp_path / "missing"
+        assert list_requirement_pdfs(str(missing)) == []
+        assert list_pdf_infos(str(missing)) == []
+        assert get_pdf_info(str(missing / "gone.pdf")) == {}
+
+    def test_pdf_info_from_path_or_entry(self, tmp_path):
+        """Test get_pdf_info gives the same result for a path and its DirEntry"""
+        from utils.pdf_discovery import get_pdf_info
 
-            assert diagram_plan_to_text is not None
-            assert render_diagrams is not None
-            assert hld_to_markdown is not None
-            assert generate_risk_heatmap is not None
-        except ImportError as e:
-            pytest.fail(f"Utility import failed: {e}")
+        pdf = tmp_path / "req.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        with os.scandir(tmp_path) as it:
+            entry = next(it)
+
+        info = get_pdf_info(str(pdf))
+        assert info == get_pdf_info(entry)
+        assert info["name"] == "req.pdf"
+
+
+
+class TestMainHelpers:
+    """Additional test: Streamlit gateway helpers"""
+
+    def test_pills_html_escapes_items(self):
+        """Test LLM strings like List<Order> render as text, not as stray tags"""
+        from main import _pills_html
+
+        html_block = _pills_html(["List<Order>", "a & b"])
+
+        assert "List&lt;Order&gt;" in html_block
+        assert "a &amp; b" in html_block
+        assert "<Order>" not in html_block
+
+class TestAgents:
+    """Additional test: Agent construction and prompts"""
+
+    @pytest.mark.parametrize("cls,key", AGENTS, ids=lambda v: getattr(v, "__name__", v))
+    def test_agent_constructs(self, cls, key):
+        """Test that each agent picks up its own API key and builds a model"""
+        agent = cls()
+        assert agent.api_key == f"test-{key}"
+        assert agent.model is not None
+
+    def test_agent_system_prompts(self, pdf_agent, auth_agent, domain_agent, behavior_agent):
+        """Test that each LLM agent exposes a JSON-only system prompt"""
+        for agent in (pdf_agent, auth_agent, domain_agent, behavior_agent):
+            prompt = agent.get_system_prompt()
+            assert isinstance(prompt, str)
+            assert "JSON" in prompt
+
+
+class TestIntegration:
+    """Additional test: Agent processing flows against a mocked LLM"""
+
+    def test_pdf_extraction_flow(self, pdf_agent, llm_response):
+        """Test PDF extraction end to end without touching the filesystem"""
+        from state.models import HLDState
+
+        llm_response(_PDF_RESPONSE_JSON)
+
+        state = HLDState(pdf_path="fake.pdf", requirement_name="test")
+        with patch("agent.pdf_agent.Path.read_bytes", return_value=b"%PDF-1.4 fake"):
+            result = pdf_agent.process(state)
+
+        assert result["success"] is True
+        assert state.extracted.meta["title"] == "Test Requirements"
+        assert state.status["pdf_extraction"].status == "completed"
+
+
+class TestWorkflowSchema:
+    """Additional test: Workflow input schema validation"""
+
+    @pytest.mark.parametrize("pdf_path,valid", [
+        ("test.pdf", True),
+        ("data/Requirement-1.pdf", True),
+        ("test.txt", False),
+    ])
+    def test_workflow_input_validation(self, pdf_path, valid, default_config):
+        """Test that WorkflowInput only accepts .pdf paths"""
+        from state.schema import WorkflowInput
+
+        if valid:
+            workflow_input = WorkflowInput(pdf_path=pdf_path, config=default_config)
+            assert workflow_input.pdf_path == pdf_path
+        else:
+            with pytest.raises(ValueError):
+                WorkflowInput(pdf_path=pdf_path, config=default_config)
+
+    def test_initial_state_creation(self, default_config):
+        """Test initial state seeds every workflow stage"""
+        from state.schema import create_initial_state, WORKFLOW_STAGES
+
+        state = create_initial_state("test.pdf", default_config)
+
+        assert state.requirement_name == "test"
+        assert state.config["image_format"] == default_config.image_format
+        assert list(state.status) == WORKFLOW_STAGES
 
 
 class TestErrorHandling:
@@ -338,6 +569,20 @@ class TestErrorHandling:
 # PYTEST CONFIGURATION AND HELPERS
 # ============================================================================
 
+@pytest.fixture
+def stubbed_nodes():
+    """Give every workflow node a _StubAgent; restores cached agents and node status afterwards"""
+    from nodes import get_node_manager
+
+    agents = _stub_agents()
+    with ExitStack() as stack:
+        for name, node in get_node_manager().get_all_nodes().items():
+            stack.enter_context(patch.dict(node.__dict__))
+            node.__dict__.pop("agent", None)
+            stack.enter_context(patch.object(type(node), "create_agent", return_value=agents[name]))
+        yield agents
+
+
 @pytest.fixture
 def sample_hld_data():
     """Fixture providing sample HLD data for tests"""
@@ -363,7 +608,6 @@ def temp_output_dir():
 if __name__ == "__main__":
     pytest.main([
         __file__,
-        "-v",  # Verbose output
         "--tb=short",  # Short traceback format
         "-ra",  # Show summary of all test outcomes
         "--color=yes"  # Colored output
@@ -1,16 +1,30 @@
 """
 Utility functions for HLD generation
+
+Exports resolve on first access, so importing one light submodule (such
+as pdf_discovery) does not pull in matplotlib and the diagram renderer.
 """
 
-from .diagram_converter import diagram_plan_to_text
-from .diagram_renderer import render_diagrams
-from .compose_output import hld_to_markdown, save_markdown
-from .risk_heatmap import generate_risk_heatmap
+from importlib import import_module
+
+_EXPORTS = {
+    "diagram_plan_to_text": ".diagram_converter",
+    "render_diagrams": ".diagram_renderer",
+    "hld_to_markdown": ".compose_output",
+    "save_markdown": ".compose_output",
+    "generate_risk_heatmap": ".risk_heatmap",
+    "list_requirement_pdfs": ".pdf_discovery",
+    "get_pdf_info": ".pdf_discovery",
+    "list_pdf_infos": ".pdf_discovery",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "diagram_plan_to_text",
-    "render_diagrams",
-    "hld_to_markdown",
-    "save_markdown", 
-    "generate_risk_heatmap"
-]
\ No newline at end of file
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
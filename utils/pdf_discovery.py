@@ -0,0 +1,67 @@
+"""
+Requirement PDF discovery helpers
+Kept free of Streamlit so setup checks and scripts can list PDFs cheaply
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Union
+
+
+def _is_requirement_pdf(entry: os.DirEntry) -> bool:
+    # Case-insensitive suffix match, so .PDF files are found on case-sensitive
+    # filesystems too; is_file() uses the entry's cached type instead of a
+    # stat per file. Hidden entries (.DS_Store, macOS ._resource forks) are
+    # dropped on the name alone.
+    return (
+        not entry.name.startswith(".")
+        and entry.name.lower().endswith(".pdf")
+        and entry.is_file()
+    )
+
+
+def _scan_pdfs(folder: str) -> List[os.DirEntry]:
+    """PDF entries of folder from a single scandir pass, sorted by name"""
+    try:
+        with os.scandir(folder) as it:
+            entries = [e for e in it if _is_requirement_pdf(e)]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def list_requirement_pdfs(folder: str = "data") -> List[str]:
+    """List available PDF files in a folder, sorted by path"""
+    return [e.path for e in _scan_pdfs(folder)]
+
+
+def get_pdf_info(pdf: Union[str, os.DirEntry]) -> Dict[str, Any]:
+    """
+    Get name, size and modification time of a PDF file
+
+    Accepts a path or a DirEntry from a directory scan; an entry reuses
+    the stat result it caches instead of looking the file up again
+    """
+    is_entry = isinstance(pdf, os.DirEntry)
+    path = pdf.path if is_entry else str(pdf)
+    name = pdf.name if is_entry else os.path.basename(path)
+
+    try:
+        stat = pdf.stat() if is_entry else os.stat(path)
+        return {
+            "name": name,
+            "size_mb": round(stat.st_size / (1024 * 1024), 2),
+            "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
+            "path": path
+        }
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        return {"name": name, "path": path}
+
+
+def list_pdf_infos(folder: str = "data") -> List[Dict[str, Any]]:
+    """get_pdf_info for every PDF in a folder, from one directory scan"""
+    infos = (get_pdf_info(e) for e in _scan_pdfs(folder))
+    return [info for info in infos if info]
@@ -3,15 +3,16 @@ Main HLD Workflow Implementation
 """
 
 import time
-from typing import Dict, Any, Optional, AsyncIterator
+from typing import Dict, Any, Optional, AsyncIterator, Callable, TYPE_CHECKING
 from pathlib import Path
 
-from langchain_core.runnables import Runnable
-
 from state.models import HLDState
 from state.schema import WorkflowInput, WorkflowOutput, ConfigSchema, create_initial_state
 from graph import create_workflow_graph, create_parallel_workflow_graph, create_conditional_workflow_graph
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 class HLDWorkflow:
     """Main workflow orchestrator for HLD generation"""
     
@@ -25,16 +26,57 @@ class HLDWorkflow:
         self.workflow_type = workflow_type
         self.graph = self._create_graph()
     
-    def _create_graph(self) -> Runnable:
+    def _create_graph(self) -> "Runnable":
         """Create the appropriate workflow graph"""
         if self.workflow_type == "parallel":
-            # Use optimized sequential execution to avoid LangGraph concurrent update issues
-            return create_parallel_workflow_graph()  # This is now optimized sequential
+            return create_parallel_workflow_graph()
         elif self.workflow_type == "conditional":
             return create_conditional_workflow_graph()
         else:
             return create_workflow_graph()
     
+    def _build_output(self, final_state_dict: Dict[str, Any], start_time: float) -> WorkflowOutput:
+        """
+        Convert the graph's final state into a WorkflowOutput
+
+        Args:
+            final_state_dict: Final state returned by the graph
+            start_time: time.time() when the run started
+
+        Returns:
+            WorkflowOutput with results and metadata
+        """
+        # Convert back to HLDState
+        final_state = HLDState.model_validate(final_state_dict)
+
+        # Prepare output paths
+        output_paths = {}
+        if final_state.output:
+            output_paths = {
+                "hld_md": final_state.output.hld_md_path,
+                "hld_html": final_state.output.hld_html_path,
+                "diagrams_html": final_state.output.diagrams_html_path,
+                "risk_heatmap": final_state.output.risk_heatmap_path
+            }
+
+        return WorkflowOutput(
+            success=not final_state.has_errors(),
+            state=final_state,
+            output_paths=output_paths,
+            processing_time=time.time() - start_time,
+            errors=final_state.errors,
+            warnings=final_state.warnings
+        )
+
+    def _failed_output(self, input_data: WorkflowInput, start_time: float, error_msg: str) -> WorkflowOutput:
+        """WorkflowOutput for a run that raised before producing a final state"""
+        return WorkflowOutput(
+            success=False,
+            state=HLDState(pdf_path=input_data.pdf_path),
+            processing_time=time.time() - start_time,
+            errors=[error_msg]
+        )
+
     def run(self, input_data: WorkflowInput) -> WorkflowOutput:
         """
         Run the HLD generation workflow
@@ -52,50 +94,21 @@ class HLDWorkflow:
             initial_state = create_initial_state(input_data.pdf_path, input_data.config)
             
             # Run the workflow
-            final_state_dict = self.graph.invoke(initial_state.dict())
-            
-            # Convert back to HLDState
-            final_state = HLDState(**final_state_dict)
+            final_state_dict = self.graph.invoke(dict(initial_state))
             
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Prepare output paths
-            output_paths = {}
-            if final_state.output:
-                output_paths = {
-                    "hld_md": final_state.output.hld_md_path,
-                    "hld_html": final_state.output.hld_html_path,
-                    "diagrams_html": final_state.output.diagrams_html_path,
-                    "risk_heatmap": final_state.output.risk_heatmap_path
-                }
-            
-            return WorkflowOutput(
-                success=not final_state.has_errors(),
-                state=final_state,
-                output_paths=output_paths,
-                processing_time=processing_time,
-                errors=final_state.errors,
-                warnings=final_state.warnings
-            )
+            return self._build_output(final_state_dict, start_time)
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            error_msg = f"Workflow execution failed: {str(e)}"
-            
-            return WorkflowOutput(
-                success=False,
-                state=HLDState(pdf_path=input_data.pdf_path),
-                processing_time=processing_time,
-                errors=[error_msg]
-            )
+            return self._failed_output(input_data, start_time, f"Workflow execution failed: {str(e)}")
     
-    async def arun(self, input_data: WorkflowInput) -> WorkflowOutput:
+    async def arun(self, input_data: WorkflowInput,
+                   on_stage_complete: Optional[Callable[[str], None]] = None) -> WorkflowOutput:
         """
         Run the workflow asynchronously
         
         Args:
             input_data: Workflow input
+            on_stage_complete: Called with the node name after each node finishes
             
         Returns:
             WorkflowOutput with results
@@ -105,45 +118,24 @@ class HLDWorkflow:
         try:
             # Create initial state
             initial_state = create_initial_state(input_data.pdf_path, input_data.config)
-            
-            # Run the workflow asynchronously
-            final_state_dict = await self.graph.ainvoke(initial_state.dict())
-            
-            # Convert back to HLDState
-            final_state = HLDState(**final_state_dict)
-            
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
-            # Prepare output paths
-            output_paths = {}
-            if final_state.output:
-                output_paths = {
-                    "hld_md": final_state.output.hld_md_path,
-                    "hld_html": final_state.output.hld_html_path,
-                    "diagrams_html": final_state.output.diagrams_html_path,
-                    "risk_heatmap": final_state.output.risk_heatmap_path
-                }
-            
-            return WorkflowOutput(
-                success=not final_state.has_errors(),
-                state=final_state,
-                output_paths=output_paths,
-                processing_time=processing_time,
-                errors=final_state.errors,
-                warnings=final_state.warnings
-            )
+            final_state_dict = dict(initial_state)
+            
+            if on_stage_complete is None:
+                # Run the workflow asynchronously
+                final_state_dict = await self.graph.ainvoke(final_state_dict)
+            else:
+                # "updates" names the node that just finished, "values" carries the full state
+                async for mode, chunk in self.graph.astream(final_state_dict, stream_mode=["updates", "values"]):
+                    if mode == "values":
+                        final_state_dict = chunk
+                    else:
+                        for node_name in chunk:
+                            on_stage_complete(node_name)
+            
+            return self._build_output(final_state_dict, start_time)
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            error_msg = f"Async workflow execution failed: {str(e)}"
-            
-            return WorkflowOutput(
-                success=False,
-                state=HLDState(pdf_path=input_data.pdf_path),
-                processing_time=processing_time,
-                errors=[error_msg]
-            )
+            return self._failed_output(input_data, start_time, f"Async workflow execution failed: {str(e)}")
     
     async def stream(self, input_data: WorkflowInput) -> AsyncIterator[Dict[str, Any]]:
         """
@@ -160,7 +152,7 @@ class HLDWorkflow:
             initial_state = create_initial_state(input_data.pdf_path, input_data.config)
             
             # Stream the workflow execution
-            async for state_update in self.graph.astream(initial_state.dict()):
+            async for state_update in self.graph.astream(dict(initial_state)):
                 yield state_update
                 
         except Exception as e: